@@ -5,10 +5,16 @@ Demonstrates complex dependency relationships across modules.
 """
 
 import sys
+import json
+import time
+import random
 import asyncio
-from typing import Optional, List
+from itertools import islice
+from typing import Optional, List, Any, Awaitable, Callable
 from dataclasses import dataclass
 
+import redis.asyncio as redis
+
 from services.user_service import UserService
 from services.notification_service import NotificationService
 from models.user import User, UserRole
@@ -16,7 +22,6 @@ from database.connection import DatabaseConnection
 from utils.logger import Logger
 from utils.config import Config
 from decorators.timing import timing_decorator
-from decorators.cache import cached
 
 
 @dataclass
@@ -24,7 +29,90 @@ class AppConfig:
     database_url: str
     debug: bool = False
     log_level: str = "INFO"
+    redis_url: str = "redis://localhost:6379/0"
     cache_ttl: int = 300
+    notify_chunk_size: int = 100
+    init_timeout: float = 30.0
+    
+    def __post_init__(self):
+        if self.notify_chunk_size <= 0:
+            raise ValueError(
+                f"notify_chunk_size must be positive, got {self.notify_chunk_size}"
+            )
+        if self.init_timeout <= 0:
+            raise ValueError(
+                f"init_timeout must be positive, got {self.init_timeout}"
+            )
+
+
+class CacheAside:
+    """
+    Redis-backed cache-aside helper shared across workers.
+    Entries are refreshed early with some probability once they near expiry,
+    so a single caller repopulates them instead of every worker at once.
+    """
+    
+    def __init__(
+        self,
+        redis_url: str,
+        early_refresh_ratio: float = 0.8,
+        early_refresh_probability: float = 0.1
+    ):
+        self.redis = redis.from_url(redis_url)
+        self.logger = Logger(__name__)
+        self.early_refresh_ratio = early_refresh_ratio
+        self.early_refresh_probability = early_refresh_probability
+    
+    async def get_or_set(
+        self,
+        key: str,
+        fetch_fn: Callable[[], Awaitable[Any]],
+        ttl: int,
+        serialize: Callable[[Any], Any],
+        deserialize: Callable[[Any], Any]
+    ) -> Any:
+        """
+        Return the cached value for key, fetching and storing it on a miss.
+        serialize must return a JSON-compatible value. If Redis is unavailable
+        or an entry cannot be decoded or encoded, the value is fetched directly
+        and the cache is left as is.
+        """
+        try:
+            raw = await self.redis.get(key)
+        except redis.RedisError as e:
+            self.logger.warning(f"Cache read failed for {key}: {e}")
+            return await fetch_fn()
+        
+        if raw is not None:
+            # Corrupt or old-format entries are treated as a miss
+            try:
+                entry = json.loads(raw)
+                age = time.time() - entry["issued"]
+                refresh_early = (
+                    age > ttl * self.early_refresh_ratio and
+                    random.random() < self.early_refresh_probability
+                )
+                if not refresh_early:
+                    return deserialize(entry["value"])
+            except (ValueError, KeyError, TypeError) as e:
+                self.logger.warning(f"Ignoring unreadable cache entry for {key}: {e!r}")
+        
+        value = await fetch_fn()
+        try:
+            payload = json.dumps({"issued": time.time(), "value": serialize(value)})
+        except (ValueError, TypeError) as e:
+            self.logger.warning(f"Cache encode failed for {key}: {e!r}")
+            return value
+        
+        try:
+            await self.redis.set(key, payload, ex=ttl)
+        except redis.RedisError as e:
+            self.logger.warning(f"Cache write failed for {key}: {e}")
+        return value
+    
+    async def close(self):
+        """Close the Redis connection."""
+        await self.redis.aclose()
 
 
 class Application:
@@ -34,61 +122,141 @@ class Application:
         self.db = DatabaseConnection(config.database_url)
         self.user_service = UserService(self.db)
         self.notification_service = NotificationService()
+        self.cache = CacheAside(config.redis_url)
+        self._pending_batches: asyncio.Queue[List[int]] = asyncio.Queue()
         
     @timing_decorator
     async def initialize(self):
         """Initialize the application components."""
         try:
-            await self.db.connect()
-            await self.user_service.initialize()
-            await self.notification_service.initialize()
+            async with asyncio.timeout(self.config.init_timeout):
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(self._initialize_user_data())
+                    tg.create_task(self.notification_service.initialize())
             self.logger.info("Application initialized successfully")
-        except Exception as e:
-            self.logger.error(f"Failed to initialize application: {e}")
+        except TimeoutError:
+            self.logger.error(
+                f"Failed to initialize application: timed out after "
+                f"{self.config.init_timeout}s"
+            )
             raise
+        except ExceptionGroup as eg:
+            # Log every failing subsystem, then surface the first cause
+            for error in eg.exceptions:
+                self.logger.error(f"Failed to initialize application: {error!r}")
+            raise eg.exceptions[0] from eg
+    
+    async def _initialize_user_data(self):
+        """Connect to the database, then initialize services that depend on it."""
+        await self.db.connect()
+        await self.user_service.initialize()
     
-    @cached(ttl=300)
     async def get_active_users(self) -> List[User]:
         """Get all active users with caching."""
-        return await self.user_service.get_users_by_status("active")
+        return await self.cache.get_or_set(
+            key="users:active",
+            fetch_fn=lambda: self.user_service.get_users_by_status("active"),
+            ttl=self.config.cache_ttl,
+            serialize=lambda users: [u.to_dict() for u in users],
+            deserialize=lambda data: [User.from_dict(d) for d in data]
+        )
     
     async def process_user_batch(self, user_ids: List[int]) -> None:
         """Process a batch of users with notifications."""
-        users = []
+        try:
+            users_raw = await self.user_service.get_users_by_ids(user_ids)
+        except Exception as e:
+            self.logger.warning(f"Failed to process user batch {user_ids}: {e}")
+            return
         
-        for user_id in user_ids:
-            try:
-                user = await self.user_service.get_user_by_id(user_id)
-                if user and user.is_active():
-                    users.append(user)
-            except Exception as e:
-                self.logger.warning(f"Failed to process user {user_id}: {e}")
-                continue
+        users = [u for u in users_raw if u and u.is_active()]
+        
+        chunk_size = self.config.notify_chunk_size
+        chunks = [users[i:i + chunk_size] for i in range(0, len(users), chunk_size)]
         
-        if users:
+        async with asyncio.TaskGroup() as tg:
+            for chunk in chunks:
+                tg.create_task(self._send_notification_chunk(chunk))
+    
+    async def _send_notification_chunk(self, users: List[User]) -> None:
+        """Send one chunk of batch notifications, logging failures."""
+        try:
             await self.notification_service.send_bulk_notifications(
                 users, 
                 "batch_processing_complete",
                 {"batch_size": len(users)}
             )
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to notify users {[u.id for u in users]}: {e}"
+            )
+    
+    def submit_user_batch(self, user_ids: List[int]) -> None:
+        """Queue a batch of users for processing by the main loop."""
+        self._pending_batches.put_nowait(user_ids)
+    
+    def _drain_pending_batches(self) -> List[int]:
+        """Merge all queued batches into one, dropping duplicate ids."""
+        merged = {}
+        while not self._pending_batches.empty():
+            for user_id in self._pending_batches.get_nowait():
+                merged[user_id] = None
+        return list(merged)
+    
+    async def _process_pending_batches(self) -> None:
+        """Process queued batches until the queue is empty."""
+        while not self._pending_batches.empty():
+            await self.process_user_batch(self._drain_pending_batches())
     
     async def run(self):
         """Main application loop."""
-        await self.initialize()
+        try:
+            await self.initialize()
+        except Exception:
+            # initialize() has logged the cause; release what was opened
+            await self.cleanup()
+            raise
+        
+        # Writes go first: batches queued during initialization are merged
+        # and sent while the active user cache is refreshed.
+        batch_task = asyncio.create_task(self._process_pending_batches())
+        cache_task = asyncio.create_task(self.get_active_users())
+        pending = {batch_task, cache_task}
         
         try:
-            # Example workflow
-            active_users = await self.get_active_users()
-            self.logger.info(f"Found {len(active_users)} active users")
-            
-            admin_users = [u for u in active_users if u.role == UserRole.ADMIN]
-            if admin_users:
-                await self.process_user_batch([u.id for u in admin_users[:10]])
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                
+                if batch_task in done:
+                    batch_task.result()
+                
+                if cache_task in done:
+                    active_users = cache_task.result()
+                    self.logger.info(f"Found {len(active_users)} active users")
+                    
+                    admin_ids = [
+                        u.id for u in islice(
+                            (u for u in active_users if u.role == UserRole.ADMIN), 10
+                        )
+                    ]
+                    if admin_ids:
+                        self.submit_user_batch(admin_ids)
+                        # A running batch task picks the ids up on its next pass
+                        if batch_task.done():
+                            batch_task = asyncio.create_task(
+                                self._process_pending_batches()
+                            )
+                            pending.add(batch_task)
                 
         except Exception as e:
             self.logger.error(f"Application error: {e}")
             raise
         finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
             await self.cleanup()
     
     async def cleanup(self):
@@ -97,14 +265,19 @@ class Application:
             await self.notification_service.close()
         if self.db:
             await self.db.close()
+        if self.cache:
+            await self.cache.close()
         self.logger.info("Application cleanup completed")
 
 
 async def main():
-    """Main function."""
+    """Main function. Returns the process exit code."""
     config = Config.load_from_env()
     app_config = AppConfig(
         database_url=config.get("DATABASE_URL", "sqlite:///test.db"),
+        redis_url=config.get("REDIS_URL", "redis://localhost:6379/0"),
+        notify_chunk_size=int(config.get("NOTIFY_CHUNK_SIZE", 100)),
+        init_timeout=float(config.get("INIT_TIMEOUT", 30.0)),
         debug=config.get("DEBUG", False),
         log_level=config.get("LOG_LEVEL", "INFO")
     )
@@ -117,8 +290,15 @@ async def main():
         print("Application interrupted by user")
     except Exception as e:
         print(f"Application failed: {e}")
-        sys.exit(1)
+        return 1
+    return 0
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    with asyncio.Runner() as runner:
+        # Eager tasks are only available on Python 3.12+
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_task_factory is not None:
+            runner.get_loop().set_task_factory(eager_task_factory)
+        exit_code = runner.run(main())
+    sys.exit(exit_code)
@@ -3,12 +3,14 @@ User model with complex relationships and validation.
 """
 
 from enum import Enum
+from types import MappingProxyType
 from typing import Optional, Dict, Any, List
 from datetime import datetime
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, FrozenInstanceError
+
+import orjson
 
 from utils.validation import ValidationMixin
-from decorators.cache import cached
 
 
 class UserRole(Enum):
@@ -27,7 +29,22 @@ class UserStatus(Enum):
     DELETED = "deleted"
 
 
-@dataclass
+# Role hierarchy levels used for management comparisons.
+_ROLE_LEVEL = {
+    UserRole.USER: 1,
+    UserRole.MODERATOR: 2,
+    UserRole.ADMIN: 3,
+    UserRole.SUPER_ADMIN: 4
+}
+
+_ADMIN_ROLES = frozenset({UserRole.ADMIN, UserRole.SUPER_ADMIN})
+
+# Direct value lookups for hydration, bypassing Enum.__call__.
+_ROLE_BY_VALUE = {r.value: r for r in UserRole}
+_STATUS_BY_VALUE = {s.value: s for s in UserStatus}
+
+
+@dataclass(slots=True)
 class UserPermissions:
     """User permissions data structure."""
     can_read: bool = True
@@ -37,11 +54,110 @@ class UserPermissions:
     custom_permissions: Dict[str, bool] = field(default_factory=dict)
 
 
+class _ReadOnlyUserPermissions(UserPermissions):
+    """Immutable default permissions shared by users created without any."""
+    __slots__ = ()
+    
+    def __new__(cls, **kwargs):
+        # dataclasses.replace() passes every field; give back a writable copy
+        if kwargs:
+            kwargs['custom_permissions'] = dict(kwargs.get('custom_permissions', {}))
+            return UserPermissions(**kwargs)
+        return super().__new__(cls)
+    
+    def __init__(self):
+        for f in fields(UserPermissions):
+            value = MappingProxyType({}) if f.name == 'custom_permissions' else f.default
+            object.__setattr__(self, f.name, value)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(
+            "Default permissions are shared; use User.set_permission instead"
+        )
+    
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(
+            "Default permissions are shared; use User.set_permission instead"
+        )
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, UserPermissions):
+            return NotImplemented
+        return all(
+            getattr(self, f.name) == getattr(other, f.name)
+            for f in fields(UserPermissions)
+        )
+    
+    # Copies and unpickled instances resolve to the module-level singleton
+    def __reduce__(self) -> str:
+        return '_DEFAULT_PERMISSIONS'
+    
+    def __copy__(self) -> '_ReadOnlyUserPermissions':
+        return self
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> '_ReadOnlyUserPermissions':
+        return self
+
+
+# Shared read-only default; User.set_permission copies it before writing.
+_DEFAULT_PERMISSIONS = _ReadOnlyUserPermissions()
+
+# Default values of the boolean permission flags, for matching stored data.
+_DEFAULT_PERMISSION_FLAGS = tuple(
+    (f.name, f.default) for f in fields(UserPermissions)
+    if f.name != 'custom_permissions'
+)
+
+# Maps standard permission names to UserPermissions attributes.
+_STANDARD_PERMS = {
+    'read': 'can_read',
+    'write': 'can_write',
+    'delete': 'can_delete',
+    'admin': 'can_admin'
+}
+
+
+# User validation rules as (field, predicate, error message).
+_VALIDATORS = (
+    ('email', lambda u: bool(u.email and '@' in u.email),
+     'Valid email address is required'),
+    ('username', lambda u: bool(u.username and len(u.username) >= 3),
+     'Username must be at least 3 characters'),
+    ('first_name', lambda u: bool(u.first_name),
+     'First name is required'),
+    ('role', lambda u: isinstance(u.role, UserRole),
+     'Invalid user role'),
+    ('status', lambda u: isinstance(u.status, UserStatus),
+     'Invalid user status')
+)
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    """Parse a stored timestamp, accepting datetimes or ISO strings."""
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def _relationship_key(user: 'User') -> Any:
+    """
+    Key a related user by id, or by object identity while it has no id.
+    Mirrors User.__eq__, where users without an id only equal themselves.
+    """
+    return user.id if user.id is not None else (None, id(user))
+
+
 class User(ValidationMixin):
     """
     User model with complex validation and relationships.
     """
     
+    __slots__ = (
+        'id', 'email', 'username', 'first_name', 'last_name', 'role',
+        'status', 'permissions', 'metadata', 'created_at', 'updated_at',
+        '_relationships', '_hash'
+    )
+    
     def __init__(
         self,
         user_id: Optional[int] = None,
@@ -52,7 +168,9 @@ class User(ValidationMixin):
         role: UserRole = UserRole.USER,
         status: UserStatus = UserStatus.ACTIVE,
         permissions: Optional[UserPermissions] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None
     ):
         self.id = user_id
         self.email = email
@@ -61,11 +179,15 @@ class User(ValidationMixin):
         self.last_name = last_name
         self.role = role
         self.status = status
-        self.permissions = permissions or UserPermissions()
+        self.permissions = permissions if permissions is not None else _DEFAULT_PERMISSIONS
         self.metadata = metadata or {}
-        self.created_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
-        self._relationships: Dict[str, List['User']] = {}
+        if created_at is None or updated_at is None:
+            now = datetime.utcnow()
+        self.created_at = created_at if created_at is not None else now
+        self.updated_at = updated_at if updated_at is not None else now
+        # Insertion-ordered buckets of related users, see _relationship_key
+        self._relationships: Dict[str, Dict[Any, 'User']] = {}
+        self._hash: Optional[int] = None
     
     @property
     def full_name(self) -> str:
@@ -75,7 +197,7 @@ class User(ValidationMixin):
     @property
     def is_admin(self) -> bool:
         """Check if user has admin role."""
-        return self.role in [UserRole.ADMIN, UserRole.SUPER_ADMIN]
+        return self.role in _ADMIN_ROLES
     
     def is_active(self) -> bool:
         """Check if user is active."""
@@ -87,41 +209,41 @@ class User(ValidationMixin):
             return True
             
         # Check standard permissions
-        standard_perms = {
-            'read': self.permissions.can_read,
-            'write': self.permissions.can_write,
-            'delete': self.permissions.can_delete,
-            'admin': self.permissions.can_admin
-        }
-        
-        if permission in standard_perms:
-            return standard_perms[permission]
+        attr = _STANDARD_PERMS.get(permission)
+        if attr is not None:
+            return getattr(self.permissions, attr)
         
         # Check custom permissions
         return self.permissions.custom_permissions.get(permission, False)
     
+    def set_permission(self, permission: str, value: bool) -> None:
+        """Set a standard or custom permission on this user."""
+        if self.permissions is _DEFAULT_PERMISSIONS:
+            self.permissions = UserPermissions()
+        
+        attr = _STANDARD_PERMS.get(permission)
+        if attr is not None:
+            setattr(self.permissions, attr, value)
+        else:
+            self.permissions.custom_permissions[permission] = value
+        self.touch()
+    
     def add_relationship(self, relationship_type: str, other_user: 'User') -> None:
         """Add relationship to another user."""
-        if relationship_type not in self._relationships:
-            self._relationships[relationship_type] = []
+        related = self._relationships.setdefault(relationship_type, {})
         
-        if other_user not in self._relationships[relationship_type]:
-            self._relationships[relationship_type].append(other_user)
+        # A user added before it was saved stays keyed by identity
+        if (None, id(other_user)) in related:
+            return
+        related.setdefault(_relationship_key(other_user), other_user)
     
     def get_relationships(self, relationship_type: str) -> List['User']:
         """Get users with specific relationship."""
-        return self._relationships.get(relationship_type, [])
+        return list(self._relationships.get(relationship_type, {}).values())
     
-    @cached(ttl=60)
     def get_role_hierarchy_level(self) -> int:
         """Get numeric role hierarchy level for comparisons."""
-        hierarchy = {
-            UserRole.USER: 1,
-            UserRole.MODERATOR: 2,
-            UserRole.ADMIN: 3,
-            UserRole.SUPER_ADMIN: 4
-        }
-        return hierarchy.get(self.role, 0)
+        return _ROLE_LEVEL.get(self.role, 0)
     
     def can_manage_user(self, other_user: 'User') -> bool:
         """Check if this user can manage another user."""
@@ -133,59 +255,41 @@ class User(ValidationMixin):
     def validate(self) -> Dict[str, List[str]]:
         """Validate user data."""
         errors = {}
-        
-        if not self.email or '@' not in self.email:
-            errors['email'] = ['Valid email address is required']
-        
-        if not self.username or len(self.username) < 3:
-            errors['username'] = ['Username must be at least 3 characters']
-        
-        if not self.first_name:
-            errors['first_name'] = ['First name is required']
-        
-        if not isinstance(self.role, UserRole):
-            errors['role'] = ['Invalid user role']
-        
-        if not isinstance(self.status, UserStatus):
-            errors['status'] = ['Invalid user status']
-        
+        for field_name, is_valid, message in _VALIDATORS:
+            if not is_valid(self):
+                errors[field_name] = [message]
         return errors
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert user to dictionary."""
-        return {
-            'id': self.id,
-            'email': self.email,
-            'username': self.username,
-            'first_name': self.first_name,
-            'last_name': self.last_name,
-            'full_name': self.full_name,
-            'role': self.role.value,
-            'status': self.status.value,
-            'permissions': {
-                'can_read': self.permissions.can_read,
-                'can_write': self.permissions.can_write,
-                'can_delete': self.permissions.can_delete,
-                'can_admin': self.permissions.can_admin,
-                'custom_permissions': self.permissions.custom_permissions
-            },
-            'metadata': self.metadata,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
-            'is_admin': self.is_admin,
-            'is_active': self.is_active()
-        }
+    def touch(self) -> None:
+        """Mark user as modified."""
+        self.updated_at = datetime.utcnow()
+    
+    # to_dict is generated after the class body, see _make_to_dict.
+    
+    def to_json(self) -> bytes:
+        """Serialize user to JSON bytes, matching the to_dict layout."""
+        return orjson.dumps(self, default=_user_default)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'User':
         """Create user from dictionary."""
-        permissions = UserPermissions(
-            can_read=data.get('permissions', {}).get('can_read', True),
-            can_write=data.get('permissions', {}).get('can_write', False),
-            can_delete=data.get('permissions', {}).get('can_delete', False),
-            can_admin=data.get('permissions', {}).get('can_admin', False),
-            custom_permissions=data.get('permissions', {}).get('custom_permissions', {})
-        )
+        perms_data = data.get('permissions', {})
+        if not perms_data.get('custom_permissions') and all(
+            perms_data.get(name, default) == default
+            for name, default in _DEFAULT_PERMISSION_FLAGS
+        ):
+            permissions = _DEFAULT_PERMISSIONS
+        else:
+            permissions = UserPermissions(
+                can_read=perms_data.get('can_read', True),
+                can_write=perms_data.get('can_write', False),
+                can_delete=perms_data.get('can_delete', False),
+                can_admin=perms_data.get('can_admin', False),
+                custom_permissions=perms_data.get('custom_permissions', {})
+            )
+        
+        role_value = data.get('role', UserRole.USER.value)
+        status_value = data.get('status', UserStatus.ACTIVE.value)
         
         return cls(
             user_id=data.get('id'),
@@ -193,10 +297,12 @@ class User(ValidationMixin):
             username=data.get('username', ''),
             first_name=data.get('first_name', ''),
             last_name=data.get('last_name', ''),
-            role=UserRole(data.get('role', UserRole.USER.value)),
-            status=UserStatus(data.get('status', UserStatus.ACTIVE.value)),
+            role=_ROLE_BY_VALUE.get(role_value) or UserRole(role_value),
+            status=_STATUS_BY_VALUE.get(status_value) or UserStatus(status_value),
             permissions=permissions,
-            metadata=data.get('metadata', {})
+            metadata=data.get('metadata', {}),
+            created_at=_parse_timestamp(data.get('created_at')),
+            updated_at=_parse_timestamp(data.get('updated_at'))
         )
     
     def __repr__(self) -> str:
@@ -208,4 +314,96 @@ class User(ValidationMixin):
         return self.id == other.id and self.id is not None
     
     def __hash__(self) -> int:
-        return hash(self.id) if self.id else hash(self.username)
\ No newline at end of file
+        if self._hash is not None:
+            return self._hash
+        if not self.id:
+            # Unsaved users hash by username until an id is assigned
+            return hash(self.username)
+        self._hash = hash(self.id)
+        return self._hash
+
+
+# Fields serialized by User.to_dict, as (key, expression) source pairs.
+# 'permissions' refers to the local built from _PERMISSION_DICT_FIELDS.
+_USER_DICT_FIELDS = (
+    ('id', 'self.id'),
+    ('email', 'self.email'),
+    ('username', 'self.username'),
+    ('first_name', 'self.first_name'),
+    ('last_name', 'self.last_name'),
+    ('full_name', 'self.full_name'),
+    ('role', 'self.role.value'),
+    ('status', 'self.status.value'),
+    ('permissions', 'permissions'),
+    ('metadata', 'self.metadata'),
+    ('created_at', 'self.created_at.isoformat()'),
+    ('updated_at', 'self.updated_at.isoformat()'),
+    ('is_admin', 'self.is_admin'),
+    ('is_active', 'self.is_active()')
+)
+
+# The shared default exposes custom_permissions as a read-only proxy,
+# so it is copied into a plain dict to stay JSON serializable.
+_PERMISSION_DICT_FIELDS = (
+    ('can_read', 'perms.can_read'),
+    ('can_write', 'perms.can_write'),
+    ('can_delete', 'perms.can_delete'),
+    ('can_admin', 'perms.can_admin'),
+    ('custom_permissions', 'dict(perms.custom_permissions)')
+)
+
+
+def _make_to_dict():
+    """Generate User.to_dict as a single specialized dict literal."""
+    permissions_body = ', '.join(
+        f"{key!r}: {expr}" for key, expr in _PERMISSION_DICT_FIELDS
+    )
+    body = ', '.join(f"{key!r}: {expr}" for key, expr in _USER_DICT_FIELDS)
+    source = (
+        "def to_dict(self):\n"
+        "    perms = self.permissions\n"
+        f"    permissions = {{{permissions_body}}}\n"
+        f"    return {{{body}}}\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(source, {}, namespace)
+    to_dict = namespace['to_dict']
+    to_dict.__qualname__ = 'User.to_dict'
+    to_dict.__doc__ = "Convert user to dictionary."
+    return to_dict
+
+
+User.to_dict = _make_to_dict()
+
+
+def _user_default(obj: Any) -> Any:
+    """
+    orjson fallback for User.to_json. Roles, statuses, timestamps and
+    regular UserPermissions are left for orjson to encode natively.
+    """
+    if isinstance(obj, User):
+        return {
+            'id': obj.id,
+            'email': obj.email,
+            'username': obj.username,
+            'first_name': obj.first_name,
+            'last_name': obj.last_name,
+            'full_name': obj.full_name,
+            'role': obj.role,
+            'status': obj.status,
+            'permissions': obj.permissions,
+            'metadata': obj.metadata,
+            'created_at': obj.created_at,
+            'updated_at': obj.updated_at,
+            'is_admin': obj.is_admin,
+            'is_active': obj.is_active()
+        }
+    if isinstance(obj, _ReadOnlyUserPermissions):
+        # orjson only encodes exact dataclass types; the shared default
+        # is a subclass holding a read-only mapping
+        return {
+            f.name: dict(obj.custom_permissions)
+            if f.name == 'custom_permissions' else getattr(obj, f.name)
+            for f in fields(UserPermissions)
+        }
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -0,0 +1,73 @@
+"""
+Tests for the User model.
+"""
+
+import copy
+import json
+import pickle
+from dataclasses import replace
+
+from models.user import User, UserPermissions, _DEFAULT_PERMISSIONS
+
+
+def test_default_permissions_copy_round_trip():
+    user = User(user_id=1, username="alice")
+    
+    assert copy.copy(user.permissions) is _DEFAULT_PERMISSIONS
+    assert copy.deepcopy(user).permissions is _DEFAULT_PERMISSIONS
+
+
+def test_default_permissions_pickle_round_trip():
+    user = User(user_id=1, username="alice")
+    
+    restored = pickle.loads(pickle.dumps(user))
+    
+    assert restored == user
+    assert restored.permissions is _DEFAULT_PERMISSIONS
+
+
+def test_default_permissions_equality_and_replace():
+    user = User(user_id=1, username="alice")
+    
+    assert user.permissions == UserPermissions()
+    assert UserPermissions() == user.permissions
+    
+    writable = replace(user.permissions, can_write=True)
+    writable.custom_permissions['export'] = True
+    assert type(writable) is UserPermissions
+    assert writable.can_write
+    assert not _DEFAULT_PERMISSIONS.can_write
+    assert 'export' not in _DEFAULT_PERMISSIONS.custom_permissions
+
+
+def test_from_dict_reuses_default_permissions():
+    default_user = User.from_dict({'id': 1, 'permissions': {'can_read': True}})
+    writer = User.from_dict({'id': 2, 'permissions': {'can_write': True}})
+    
+    assert default_user.permissions is _DEFAULT_PERMISSIONS
+    assert writer.permissions is not _DEFAULT_PERMISSIONS
+    assert writer.permissions.can_write
+
+
+def test_relationships_keep_order_and_accept_unsaved_users():
+    user = User(user_id=1, username="alice")
+    unsaved = User(username="bob")
+    saved = User(user_id=5, username="carol")
+    
+    for other in (unsaved, saved, unsaved, User(user_id=5, username="carol")):
+        user.add_relationship('friend', other)
+    
+    assert user.get_relationships('friend') == [unsaved, saved]
+    
+    unsaved.id = 9
+    user.add_relationship('friend', unsaved)
+    assert len(user.get_relationships('friend')) == 2
+
+
+def test_to_json_matches_to_dict():
+    default_user = User(user_id=1, username="alice", metadata={'team': 'core'})
+    custom_user = User(user_id=2, username="bob")
+    custom_user.set_permission('export', True)
+    
+    for user in (default_user, custom_user):
+        assert json.loads(user.to_json()) == user.to_dict()